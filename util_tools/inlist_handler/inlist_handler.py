@@ -4,11 +4,14 @@ Author: Jordan Van Beeck <jordanvanbeeck@hotmail.com>
 """
 # import the necessary packages
 import ast
+import copy
 import logging
+import os
 import re
-import shlex
-import sys
-from functools import partialmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import PurePath
+from types import MappingProxyType
 
 
 # set up logger
@@ -19,81 +22,61 @@ logger = logging.getLogger(__name__)
 class InlistHandler:
     """Python class that handles how inlists are parsed."""
 
-    # --------------------------------------------------------------- #
-    # Define the method that will be used for functional type mapping #
-    # --------------------------------------------------------------- #
-    @staticmethod
-    def _multi_check_method(
-        value_string, check_values, any_check=False, all_check=False
-    ):
-        """Internal utility method used to check a condition / multiple conditions for the typing.
-
-        Parameters
-        ----------
-        value_string: str
-            The input string whose type needs to be verified.
-        check_values: list[str]
-            Specific values of the string that need to be checked.
-        any_check: bool, optional
-            If True, perform a 'any' check. If False, do not perform a 'any' check; by default False.
-        all_check: bool, optional
-            If True, perform a 'all' check. If False, do not perform a 'all' check; by default False.
-
-        Returns
-        -------
-        bool
-            The outcome of the check for the typing.
-        """
-        # return the outcome of the check
-        if any_check:
-            # check if any of the conditions match
-            return any(
-                _check_value in value_string for _check_value in check_values
-            )
-        elif all_check:
-            # check if all conditions match
-            return all(
-                _check_value in value_string for _check_value in check_values
-            )
-        else:
-            logger.error('No specified check method mentioned. Now exiting.')
-            sys.exit()
-
     # ---------------------------------------------------------- #
     # Define the enumeration elements used for typing operations #
     # ---------------------------------------------------------- #
-    # define the functional mappings for the typing operations
-    string_check = partialmethod(
-        _multi_check_method, check_values=[r"'", r'"'], any_check=True
-    )
-    bool_check = partialmethod(
-        _multi_check_method,
-        check_values=['False', 'FALSE', 'True', 'TRUE'],
-        any_check=True,
-    )
-    bool_false_check = partialmethod(
-        _multi_check_method, check_values=['False', 'FALSE'], any_check=True
-    )
-    list_check = partialmethod(
-        _multi_check_method, check_values=['[', ']'], all_check=True
-    )
-    tuple_check = partialmethod(
-        _multi_check_method, check_values=['(', ')'], all_check=True
-    )
-    none_check = partialmethod(
-        _multi_check_method, check_values=['None'], all_check=True
-    )
-    float_check = partialmethod(
-        _multi_check_method, check_values=['.'], all_check=True
+    # define the mapping of the first character of the input
+    # to the name of the method that performs its typing
+    first_character_typing = {
+        '[': '_as_literal',
+        '(': '_as_literal',
+        "'": '_as_string',
+        '"': '_as_string',
+        'T': '_as_keyword',
+        'F': '_as_keyword',
+        'N': '_as_keyword',
+    }
+    # define the values of the keyword input
+    keyword_values = {
+        'True': True,
+        'TRUE': True,
+        'False': False,
+        'FALSE': False,
+        'None': None,
+    }
+    # define and compile the regular expression used to classify numeric input,
+    # allowing underscores between digits (e.g. 1_000), as int/float do
+    compiled_number_regex = re.compile(
+        r"""
+        (?P<int>[+-]?\d(?:_?\d)*)
+        | (?P<float>
+            [+-]?(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)? | \.\d(?:_?\d)*)
+            (?:[eE][+-]?\d(?:_?\d)*)?
+        )
+        """,
+        re.VERBOSE,
     )
 
-    # ---------------------------------------------------------------------- #
-    # Define the enumeration elements that allow the selection of the inlist #
-    # ---------------------------------------------------------------------- #
-    # define and compile the regular expression used to select the defaults inlist
-    compiled_regex_defaults = re.compile(r'(.*)\/.*\/(.*)\..*')
-    # define and compile the regular expression used to check for floats
-    compiled_float_regex = re.compile(r'\d+[eE]-*\d+')
+    # -------------------------------------------------------------- #
+    # Define the enumeration elements used for parsing of the inlist #
+    # -------------------------------------------------------------- #
+    # define and compile the regular expression used to tokenize the inlist:
+    # comment symbols (%) end a value unless they are part of a quoted string,
+    # so that comments are skipped during the same sweep, and any other input
+    # that is not a key-value pair is captured so that it can be reported
+    compiled_key_value_regex = re.compile(
+        r"""
+        %[^\n]*                                            # comment
+        | ([A-Za-z_][\w.-]*)[ \t]*=[ \t]*(                 # key
+            '[^'\n]*' | "[^"\n]*"                          # string
+            | \[(?:'[^'\n]*' | "[^"\n]*" | [^'"%\n=])*\]   # list
+            | \((?:'[^'\n]*' | "[^"\n]*" | [^'"%\n=])*\)   # tuple
+            | [^\s%]+                                      # other
+        )
+        | ([^\s%]+)                                        # invalid
+        """,
+        re.VERBOSE,
+    )
 
     # ---------------------------------------------------------- #
     # Define the method that performs the typing of parsed input #
@@ -112,56 +95,219 @@ class InlistHandler:
         typed_value : type-dependent
             The value_string converted to the appropriate type.
         """
-        # check for common symbols that indicate the presence of string input
-        if cls.__dict__['string_check'].__get__(cls)(value_string):
-            if cls.__dict__['list_check'].__get__(cls)(value_string):
-                logger.debug(f'{value_string} is considered a list of strings.')
-                typed_value = ast.literal_eval(value_string)
-            else:
-                _de_quoted_string = value_string.strip('"').strip("'")
-                logger.debug(
-                    f'{value_string} is considered a string, so is replaced '
-                    f'with {_de_quoted_string}.'
-                )
-                typed_value = str(_de_quoted_string)
-        # check for input that is reminiscent of a boolean value
-        elif cls.__dict__['bool_check'].__get__(cls)(value_string):
-            logger.debug(f'{value_string} is considered a boolean.')
-            if cls.__dict__['bool_false_check'].__get__(cls)(value_string):
-                typed_value = False
-            else:
-                typed_value = True
-        # check for input that is None
-        elif cls.__dict__['none_check'].__get__(cls)(value_string):
-            logger.debug(f'{value_string} is considered a boolean.')
-            typed_value = None
-        # check for a list input
-        elif cls.__dict__['list_check'].__get__(cls)(value_string):
-            logger.debug(f'{value_string} is considered a list.')
-            typed_value = ast.literal_eval(value_string)
-        # check for a tuple input
-        elif cls.__dict__['tuple_check'].__get__(cls)(value_string):
-            logger.debug(f'{value_string} is considered a tuple.')
-            typed_value = ast.literal_eval(value_string)
-        # check for a decimal point in the input
-        elif cls.__dict__['float_check'].__get__(cls)(value_string) or (
-            cls.compiled_float_regex.match(value_string)
-        ):
-            logger.debug(f'{value_string} is considered a float.')
-            typed_value = ast.literal_eval(value_string)
+        # retrieve the typing method based on the first character of the input
+        _typing_method = cls.first_character_typing.get(
+            value_string[:1], '_as_number'
+        )
+        return getattr(cls, _typing_method)(value_string)
+
+    @staticmethod
+    def _as_literal(value_string):
+        """Internal utility method used to type list and tuple input.
+
+        Parameters
+        ----------
+        value_string : str
+            The value read from the inlist, in string format.
+
+        Raises
+        ------
+        ValueError
+            If the input is not a valid list or tuple.
+
+        Returns
+        -------
+        list or tuple
+            The evaluated list or tuple.
+        """
+        logger.debug('%s is considered a list or tuple.', value_string)
+        try:
+            return ast.literal_eval(value_string)
+        except SyntaxError as e:
+            raise ValueError(
+                f'The value {value_string} is not a valid list or tuple.'
+            ) from e
+
+    @staticmethod
+    def _as_string(value_string):
+        """Internal utility method used to type quoted string input.
+
+        Parameters
+        ----------
+        value_string : str
+            The value read from the inlist, in string format.
+
+        Raises
+        ------
+        ValueError
+            If the input has no closing quotation.
+
+        Returns
+        -------
+        str
+            The de-quoted string.
+        """
+        # check for the closing quotation
+        if len(value_string) < 2 or value_string[-1] != value_string[0]:
+            raise ValueError(
+                f'The value {value_string} has no closing quotation.'
+            )
+        _de_quoted_string = value_string.strip('"').strip("'")
+        logger.debug(
+            '%s is considered a string, so is replaced with %s.',
+            value_string,
+            _de_quoted_string,
+        )
+        return _de_quoted_string
+
+    @classmethod
+    def _as_keyword(cls, value_string):
+        """Internal utility method used to type boolean and None input.
+
+        Parameters
+        ----------
+        value_string : str
+            The value read from the inlist, in string format.
+
+        Returns
+        -------
+        bool or None or int or float
+            The boolean or None value. Non-keyword input is typed as a number.
+        """
+        # check for keyword input
+        if value_string in cls.keyword_values:
+            logger.debug('%s is considered a keyword.', value_string)
+            return cls.keyword_values[value_string]
+        # otherwise, the value is treated as a number
+        return cls._as_number(value_string)
+
+    @classmethod
+    def _as_number(cls, value_string):
+        """Internal utility method used to type numeric input.
+
+        Parameters
+        ----------
+        value_string : str
+            The value read from the inlist, in string format.
+
+        Raises
+        ------
+        ValueError
+            If the input is not numeric.
+
+        Returns
+        -------
+        int or float
+            The numeric value.
+        """
+        # classify the input in a single match
+        _match = cls.compiled_number_regex.fullmatch(value_string)
+        if _match is None:
+            raise ValueError(
+                f'The type of the value {value_string} could not be inferred.'
+            )
+        # check for a decimal point or exponent in the input
+        elif _match.lastgroup == 'float':
+            logger.debug('%s is considered a float.', value_string)
+            return float(value_string)
         # otherwise, the value is treated as an integer
         else:
-            logger.debug(f'{value_string} is considered an integer.')
-            typed_value = int(value_string)
-        return typed_value
+            logger.debug('%s is considered an integer.', value_string)
+            return int(value_string)
 
     # ------------------------------------------- #
     # Define the method that performs the parsing #
     # ------------------------------------------- #
+    @classmethod
+    def _read_inlist(cls, inlist_path):
+        """Internal utility method that reads a user inlist and obtains the values of the input parameters.
+
+        Parameters
+        ----------
+        inlist_path: str
+            Name of the inlist used for the iterative prewhitening run.
+
+        Raises
+        ------
+        ValueError
+            If the inlist contains input that is neither a comment nor a key-value pair.
+
+        Returns
+        -------
+        dictionary_inlist: dict
+            Contains the key-value pairs of the values specified in the inlist.
+        """
+        # initialize the dictionary that will hold the values
+        dictionary_inlist = {}
+        # parse the inlist
+        with open(inlist_path, 'r', buffering=1048576) as _inlist:
+            # read the complete inlist as one string
+            _text = _inlist.read()
+        # tokenize the key-value pairs in a single sweep,
+        # skipping the comments
+        for _keyword, _value, _invalid in cls.compiled_key_value_regex.findall(
+            _text
+        ):
+            # report input that is not a key-value pair
+            if _invalid:
+                raise ValueError(
+                    f'The input {_invalid} in {inlist_path} is not a key-value pair.'
+                )
+            # add or update the typed value to the dictionary
+            elif _keyword:
+                dictionary_inlist[_keyword] = cls._typer(_value)
+        return dictionary_inlist
+
+    @staticmethod
+    def _file_stamp(inlist_path):
+        """Internal utility method that retrieves the modification time and size of an inlist file.
+
+        Parameters
+        ----------
+        inlist_path: str
+            Name of the inlist file.
+
+        Returns
+        -------
+        tuple[int, int]
+            The modification time (in nanoseconds) and size (in bytes) of the inlist file.
+        """
+        _stat = os.stat(inlist_path)
+        return _stat.st_mtime_ns, _stat.st_size
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _parse_cached(cls, inlist_path, mtime_ns, size):
+        """Internal utility method that memoizes the parsed content of an inlist.
+
+        Notes
+        -----
+        The modification time and size of the inlist file are part of the cache key, so that an edited inlist is parsed anew.
+
+        Parameters
+        ----------
+        inlist_path: str
+            Name of the inlist used for the iterative prewhitening run.
+        mtime_ns: int
+            Modification time of the inlist file, in nanoseconds.
+        size: int
+            Size of the inlist file, in bytes.
+
+        Returns
+        -------
+        MappingProxyType
+            Read-only view of the key-value pairs of the values specified in the inlist.
+        """
+        return MappingProxyType(cls._read_inlist(inlist_path))
+
     @classmethod
     def _parse_inlist(cls, inlist_path, dictionary_inlist=None):
         """Internal utility method that parses a user inlist and obtains the values of the input parameters.
 
+        Notes
+        -----
+        The parsed values are cached and are not copied, so they should not be altered.
+
         Parameters
         ----------
         inlist_path: str
@@ -177,55 +323,55 @@ class InlistHandler:
         # make immutable argument
         if dictionary_inlist is None:
             dictionary_inlist = {}
-        # parse the inlist
-        try:
-            with open(inlist_path) as _inlist:
-                # read the complete inlist as one string and
-                # initialize the lexical analysis engine (shlex object)
-                _lex = shlex.shlex('\n'.join(_inlist.readlines()))
-                # replace the comment symbol by %
-                _lex.commenters = '%'
-                # add the decimal dot to the word characters,
-                # in order to obtain float values in full.
-                _lex.wordchars += '.'
-                # add the minus sign to the word characters,
-                # in order to obtain negative values in full.
-                _lex.wordchars += '-'
-                # add the square brackets and the comma to the word characters,
-                # in order to obtain list values in full.
-                _lex.wordchars += '['
-                _lex.wordchars += ']'
-                _lex.wordchars += ','
-                # add the round brackets to the word characters,
-                # in order to obtain tuple values in full.
-                _lex.wordchars += '('
-                _lex.wordchars += ')'
-                # add the quotes " and '
-                _lex.quotes = '\'"'
-                # add escape quotes to denote lines
-                _lex.escape = '\n'
-                # iterate through the analyzed strings
-                for _i in _lex:
-                    _keyword = _i  # get the keyword for the dictionary
-                    _lex.get_token()  # remove the "=" sign
-                    _value = cls._typer(_lex.get_token())
-                    # get the value for the dictionary
-                    # add or update the value to the dictionary
-                    dictionary_inlist[f'{_keyword}'] = _value
-        except NameError:
-            logger.exception('A variable was/variables were not defined.')
-        except TypeError:
-            logger.exception('The type of a variable/variables was wrong.')
-        else:
-            return dictionary_inlist
+        # parse the inlist, or retrieve its cached parsed content
+        _parsed = cls._parse_cached(inlist_path, *cls._file_stamp(inlist_path))
+        # add or update the (cached) values to the dictionary
+        dictionary_inlist.update(_parsed)
+        return dictionary_inlist
 
     # ------------------------------------------------------------------------------- #
     # Define the method that shall be used to parse and set the default inlist values #
     # ------------------------------------------------------------------------------- #
+    @staticmethod
+    def _get_defaults_path(inlist_path):
+        """Internal utility method that reconstructs the path to the inlist: 'xxxx.defaults'.
+
+        Parameters
+        ----------
+        inlist_path: str
+            The name of the inlist from which the .defaults inlist name will be reconstructed.
+
+        Raises
+        ------
+        NameError
+            If the path of the inlist does not contain the parent directories required by the conventional naming.
+
+        Returns
+        -------
+        str
+            Path to the inlist containing the defaults.
+        """
+        # the defaults file shares the name of the inlist and is stored in
+        # the 'defaults' directory, next to the directory of the inlist
+        _inlist_path = PurePath(inlist_path)
+        if len(_inlist_path.parents) < 2:
+            raise NameError(
+                f'No file was found at the path {inlist_path} that matches the conventional naming.'
+            )
+        return str(
+            _inlist_path.parent.parent
+            / 'defaults'
+            / f'{_inlist_path.stem}.defaults'
+        )
+
     @classmethod
     def _get_default_inlist_values(cls, inlist_path):
         """Class method that obtains the default values obtained from the inlist: 'xxxx.defaults'.
 
+        Notes
+        -----
+        The parsed values of the defaults inlist are cached until the defaults inlist changes, see `_parse_inlist`.
+
         Parameters
         ----------
         inlist_path: str
@@ -234,54 +380,112 @@ class InlistHandler:
         Raises
         ------
         NameError
-            If no filepath was obtained that matches the compiled regular expression conventional naming.
+            If the path of the inlist does not contain the parent directories required by the conventional naming.
 
         Returns
         -------
         dict
             Contains the key-value pairs of the values specified in the inlist containing the defaults.
         """
-        # obtain the matches for creating the path to the defaults file
-        _defaults_matches = cls.compiled_regex_defaults.match(inlist_path)
-        # construct the name of the defaults file and return
-        # the values of the parameters in the defaults file
-        if _defaults_matches is None:
-            raise NameError(
-                f'No file was found at the path {inlist_path} that matches the conventional naming.'
-            )
-        else:
-            return cls._parse_inlist(
-                f'{_defaults_matches.group(1)}/defaults/'
-                f'{_defaults_matches.group(2)}.defaults'
-            )
+        # return the values of the parameters in the defaults file
+        return cls._parse_inlist(cls._get_defaults_path(inlist_path))
 
     # -------------------------------------------------------- #
     # Define the (main) method that retrieves the inlist input #
     # -------------------------------------------------------- #
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _get_inlist_values_cached(
+        cls, inlist_path, inlist_stamp, defaults_stamp
+    ):
+        """Internal utility method that memoizes the default inlist values, updated with the inlist values.
+
+        Notes
+        -----
+        The stamps of the inlist and defaults inlist are part of the cache key, so that the values are retrieved anew when either file changes.
+
+        Parameters
+        ----------
+        inlist_path: str
+            Name of the inlist used to define the input for the run.
+        inlist_stamp: tuple[int, int]
+            Modification time and size of the inlist file, see `_file_stamp`.
+        defaults_stamp: tuple[int, int]
+            Modification time and size of the defaults inlist file, see `_file_stamp`.
+
+        Returns
+        -------
+        MappingProxyType
+            Read-only view of the key-value pairs of the input parameters specified in the inlist.
+        """
+        # get the (cached) default values of the inlist
+        _dictionary_inlist = cls._get_default_inlist_values(
+            inlist_path=inlist_path
+        )
+        # update them with the key-value pairs in the inlist, which is only
+        # cached as part of the updated dictionary
+        _dictionary_inlist.update(cls._read_inlist(inlist_path))
+        return MappingProxyType(_dictionary_inlist)
+
     @classmethod
     def get_inlist_values(cls, inlist_path):
         """Utility method that retrieves the default inlist values, and updates them, if necessary.
 
+        Notes
+        -----
+        The retrieved values are cached until the inlist or its defaults inlist changes. Each call returns a copy of the cached values, which can safely be altered.
+
         Parameters
         ----------
         inlist_path: str
             Name of the inlist used to define the input for the run.
 
+        Raises
+        ------
+        NameError
+            If the path of the inlist does not contain the parent directories required by the conventional naming.
+        ValueError
+            If the inlist or defaults inlist contains malformed input, such as values of which the type could not be inferred, unclosed quotations or invalid lists or tuples.
+
         Returns
         -------
         dictionary_inlist: dict
             Contains the key-value pairs of the input parameters specified in the inlist.
         """
-        # get the default values of the inlist
-        _dictionary_inlist_default = cls._get_default_inlist_values(
-            inlist_path=inlist_path
+        # get the path to the defaults inlist
+        _defaults_path = cls._get_defaults_path(inlist_path)
+        # get the (cached) updated key-value pairs in the inlist
+        _dictionary_inlist = cls._get_inlist_values_cached(
+            inlist_path,
+            cls._file_stamp(inlist_path),
+            cls._file_stamp(_defaults_path),
         )
-        # get updated dictionary containing key-value pairs in the inlist
-        try:
-            dictionary_inlist = cls._parse_inlist(
-                inlist_path, dictionary_inlist=_dictionary_inlist_default
+        # return a copy, so that callers cannot alter the cached values
+        return copy.deepcopy(dict(_dictionary_inlist))
+
+    @classmethod
+    def get_many(cls, inlist_paths, max_workers=None):
+        """Utility method that retrieves the inlist values of multiple inlists, in parallel threads.
+
+        Parameters
+        ----------
+        inlist_paths: list[str]
+            Names of the inlists used to define the input for the runs.
+        max_workers: int or None, optional
+            Maximum number of threads used to retrieve the inlist values. If None, the default of ThreadPoolExecutor is used; by default None.
+
+        Returns
+        -------
+        dict
+            Contains the key-value pairs of the input parameters specified in each inlist, keyed by inlist path.
+        """
+        # store the paths, so that they can be iterated over twice
+        inlist_paths = list(inlist_paths)
+        # retrieve the inlist values in parallel, overlapping the file reads
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(
+                zip(
+                    inlist_paths,
+                    executor.map(cls.get_inlist_values, inlist_paths),
+                )
             )
-        except NameError:
-            logger.exception('A variable was/variables were not defined.')
-        else:
-            return dictionary_inlist
@@ -3,9 +3,12 @@
 Author: Jordan Van Beeck <jordanvanbeeck@hotmail.com>
 """
 # import the necessary packages
-import tomllib
 import logging
-from collections import abc
+import os
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 
 
 # set up logger
@@ -17,6 +20,37 @@ class TomlInlistHandler:
     """Python class that handles how toml-format inlists are handled."""
 
     # define the method that parses the toml-format inlist
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _parse_cached(cls, inlist_path, mtime_ns, size):
+        """Utility method that parses the toml-format inlist and memoizes the result.
+
+        Notes
+        -----
+        The modification time and size of the inlist file are part of the cache key, so that an edited inlist is parsed anew.
+
+        Parameters
+        ----------
+        inlist_path : str
+            Path to the toml-format inlist file.
+        mtime_ns : int
+            Modification time of the inlist file, in nanoseconds.
+        size : int
+            Size of the inlist file, in bytes.
+
+        Returns
+        -------
+        MappingProxyType
+            Read-only view of the parsed key-value pairs, adjusted for None values.
+        """
+        # open the toml-format inlist and retrieve the data in a dict
+        with open(inlist_path, 'rb', buffering=1048576) as fp:
+            parsed_dictionary = tomllib.load(fp)
+        # adjust input data to obtain None value input, once per parse
+        cls._adjust_for_none(parsed_dictionary)
+        # return a read-only view of the dict
+        return MappingProxyType(parsed_dictionary)
+
     @classmethod
     def _parse_toml_inlist(cls, inlist_path):
         """Utility method that parses the toml-format inlist.
@@ -29,13 +63,59 @@ class TomlInlistHandler:
         Returns
         -------
         parsed_dictionary : dict
-            Contains the parsed key-value pairs.
+            Contains the parsed key-value pairs, adjusted for None values.
         """
-        # open the toml-format inlist and retrieve the data in a dict
-        with open(inlist_path, 'rb') as fp:
-            parsed_dictionary = tomllib.load(fp)
-        # return the dict
-        return parsed_dictionary
+        # retrieve the (cached) parsed toml-format inlist
+        _stat = os.stat(inlist_path)
+        _parsed = cls._parse_cached(
+            inlist_path, _stat.st_mtime_ns, _stat.st_size
+        )
+        # return a copy of the dict, so that callers cannot alter the cache
+        return cls._copy_parsed(_parsed)
+
+    # copy parsed values
+    @staticmethod
+    def _copy_parsed(parsed_dict):
+        """Copy the (nested) tables and arrays of parsed values.
+
+        Notes
+        -----
+        The tables and arrays are walked with an explicit stack, so that deeply nested input does not raise a RecursionError. All other parsed values are immutable, and are therefore not copied.
+
+        Parameters
+        ----------
+        parsed_dict : Mapping
+            Contains the parsed dictionary keys and values.
+
+        Returns
+        -------
+        dict
+            Copy of the parsed dictionary keys and values.
+        """
+        _copied_dict = {}
+        # walk the (nested) tables and arrays with an explicit stack,
+        # storing each source container together with its copy
+        _stack = [(parsed_dict, _copied_dict)]
+        while _stack:
+            _source, _copy = _stack.pop()
+            _items = (
+                enumerate(_source)
+                if isinstance(_source, list)
+                else _source.items()
+            )
+            for key, val in _items:
+                # nested table detected: copy deeper-lying values
+                if isinstance(val, dict):
+                    _copy[key] = {}
+                    _stack.append((val, _copy[key]))
+                # nested array detected: copy deeper-lying values
+                elif isinstance(val, list):
+                    _copy[key] = [None] * len(val)
+                    _stack.append((val, _copy[key]))
+                # immutable value
+                else:
+                    _copy[key] = val
+        return _copied_dict
 
     # adjust for None values
     @classmethod
@@ -47,13 +127,19 @@ class TomlInlistHandler:
         parsed_dict : dict
             Contains the parsed dictionary keys and values.
         """
-        for key, val in parsed_dict.items():
-            # adjust for None values
-            if val == {}:
-                parsed_dict[key] = None
-            # nested dictionary detected: parse deeper-lying values
-            elif isinstance(val, abc.Mapping):
-                cls._adjust_for_none(val)
+        # walk the (nested) dictionaries with an explicit stack
+        _stack = [parsed_dict]
+        while _stack:
+            _dict = _stack.pop()
+            for key, val in _dict.items():
+                # nested dictionary detected
+                if isinstance(val, dict):
+                    # adjust for None values
+                    if not val:
+                        _dict[key] = None
+                    # parse deeper-lying values
+                    else:
+                        _stack.append(val)
 
     # define the main method that retrieves the inlist input
     @classmethod
@@ -65,14 +151,44 @@ class TomlInlistHandler:
         inlist_path : str
             Path to the toml inlist file.
 
+        Notes
+        -----
+        The parsed values are cached until the toml inlist file changes. Each call returns a copy of the cached values, which can safely be altered.
+
         Returns
         -------
         toml_input_data : dict
             Contains the key-value pairs of the input parameters specified in the inlist.
         """
-        # get the parsed toml-format input data
+        # get the parsed toml-format input data, adjusted for None values
         toml_input_data = cls._parse_toml_inlist(inlist_path=inlist_path)
-        # adjust input data to obtain None value input
-        cls._adjust_for_none(toml_input_data)
         # return the parsed input data
         return toml_input_data
+
+    # define the method that retrieves the input of multiple inlists
+    @classmethod
+    def get_many(cls, inlist_paths, max_workers=None):
+        """Utility method that retrieves the inlist values of multiple inlists, in parallel threads.
+
+        Parameters
+        ----------
+        inlist_paths : list[str]
+            Paths to the toml inlist files.
+        max_workers : int or None, optional
+            Maximum number of threads used to retrieve the inlist values. If None, the default of ThreadPoolExecutor is used; by default None.
+
+        Returns
+        -------
+        dict
+            Contains the key-value pairs of the input parameters specified in each inlist, keyed by inlist path.
+        """
+        # store the paths, so that they can be iterated over twice
+        inlist_paths = list(inlist_paths)
+        # retrieve the inlist values in parallel, overlapping the file reads
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(
+                zip(
+                    inlist_paths,
+                    executor.map(cls.get_inlist_values, inlist_paths),
+                )
+            )
@@ -30,14 +30,25 @@ def inlist_file(tmp_path_factory):
         my_capital_bool = FALSE
         % int load check
         my_int = 8
+        my_separated_int = 1_000
+        % key load checks
+        my-hyphen-key = 1
+        my.dotted.key = 2
+        my_first_pair = 3 my_second_pair = 4
+        my_first_list = [1,2] my_second_list = [3]
+        my_first_tuple = (1,2) my_second_tuple = (3,4)
         % list load check
         my_list = [2,1,1,1,2]
         my_list_second = [8.0,7.0,6.0]
+        my_spaced_list = [3, 2, 1]
+        my_string_list = ['a%b', "c"] % trailing comment check
         % string load check
         my_string = 'this is a string'
         my_string_second = '/path/to/somewhere'
+        my_format_string = '%5.2f' % quoted comment symbol check
         % float load check
         my_float = 8.0
+        my_exponent_float = -1e-5
         % generic comment load check
         my_comment_load = 8%7%6
         """
@@ -57,11 +68,24 @@ def setup_test_class(request):
         'my_bool': True,
         'my_capital_bool': False,
         'my_int': 8,
+        'my_separated_int': 1000,
+        'my-hyphen-key': 1,
+        'my.dotted.key': 2,
+        'my_first_pair': 3,
+        'my_second_pair': 4,
+        'my_first_list': [1, 2],
+        'my_second_list': [3],
+        'my_first_tuple': (1, 2),
+        'my_second_tuple': (3, 4),
         'my_list': [2, 1, 1, 1, 2],
         'my_list_second': [8.0, 7.0, 6.0],
+        'my_spaced_list': [3, 2, 1],
+        'my_string_list': ['a%b', 'c'],
         'my_string': 'this is a string',
         'my_string_second': '/path/to/somewhere',
+        'my_format_string': '%5.2f',
         'my_float': 8.0,
+        'my_exponent_float': -1e-5,
         'my_comment_load': 8,
     }
 
@@ -82,3 +106,90 @@ class TestTomlInlistHandler:
         )
         # assert the output is ok
         assert my_output == self.expected_output
+
+    def test_cached_read(self, tmp_path):
+        """Test whether cached inlist values are isolated from callers and refreshed when the inlist changes."""
+        # generate a temporary inlist file + defaults
+        my_path = tmp_path / 'my_data' / 'cache.in'
+        my_path.parent.mkdir()
+        my_path_default = tmp_path / 'defaults' / 'cache.defaults'
+        my_path_default.parent.mkdir()
+        my_path_default.write_text('my_int = 1\nmy_list = [1,2]\n')
+        my_path.write_text('my_int = 2\n')
+        # read the input and alter the output
+        my_output = InlistHandler.get_inlist_values(inlist_path=str(my_path))
+        assert isinstance(my_output, dict)
+        my_output['my_int'] = 3
+        my_output['my_list'].append(3)
+        # assert the cached output was not altered
+        assert InlistHandler.get_inlist_values(
+            inlist_path=str(my_path)
+        ) == {'my_int': 2, 'my_list': [1, 2]}
+        # alter the inlist and assert the new values are read
+        my_path.write_text('my_int = 30\n')
+        assert InlistHandler.get_inlist_values(
+            inlist_path=str(my_path)
+        ) == {'my_int': 30, 'my_list': [1, 2]}
+        # alter the defaults and assert the new default values are read
+        my_path_default.write_text('my_int = 1\nmy_list = [10,20]\n')
+        assert InlistHandler.get_inlist_values(
+            inlist_path=str(my_path)
+        ) == {'my_int': 30, 'my_list': [10, 20]}
+
+    def test_invalid_read(self, tmp_path):
+        """Test whether an inlist value of unknown type or non key-value input raises an error."""
+        # generate a temporary inlist file + defaults
+        my_path = tmp_path / 'my_data' / 'invalid.in'
+        my_path.parent.mkdir()
+        my_path_default = tmp_path / 'defaults' / 'invalid.defaults'
+        my_path_default.parent.mkdir()
+        my_path_default.write_text('my_int = 1\n')
+        my_path.write_text('my_int = not_a_number\n')
+        # assert the error is raised
+        with pytest.raises(ValueError):
+            InlistHandler.get_inlist_values(inlist_path=str(my_path))
+        # alter the inlist to contain input that is not a key-value pair
+        # and assert the error is raised
+        my_path.write_text('my_int = 2\nmy_typo 3\n')
+        with pytest.raises(ValueError):
+            InlistHandler.get_inlist_values(inlist_path=str(my_path))
+        # assert an error is raised for an unclosed quotation
+        # and for a malformed list
+        for my_text in ["my_int = 'unterminated\n", 'my_int = [1, 2 % c\n']:
+            my_path.write_text(my_text)
+            with pytest.raises(ValueError):
+                InlistHandler.get_inlist_values(inlist_path=str(my_path))
+
+    def test_defaults_path(self, tmp_path, monkeypatch):
+        """Test whether the defaults inlist is found next to the directory of a relative inlist path."""
+        # generate a temporary inlist file + defaults, and use relative paths
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'run').mkdir()
+        (tmp_path / 'defaults').mkdir()
+        (tmp_path / 'defaults' / 'relative.defaults').write_text('my_int = 1\n')
+        (tmp_path / 'run' / 'relative.in').write_text('my_bool = True\n')
+        # assert the defaults are read for an inlist in a directory
+        assert InlistHandler.get_inlist_values(
+            inlist_path='run/relative.in'
+        ) == {'my_int': 1, 'my_bool': True}
+        # assert an error is raised for an inlist without a directory
+        with pytest.raises(NameError):
+            InlistHandler.get_inlist_values(inlist_path='relative.in')
+
+    def test_read_many(self, inlist_file, tmp_path):
+        """Test whether the input info of multiple inlists can be read."""
+        # generate a second temporary inlist file + defaults
+        my_path = tmp_path / 'my_data' / 'second.in'
+        my_path.parent.mkdir()
+        my_path_default = tmp_path / 'defaults' / 'second.defaults'
+        my_path_default.parent.mkdir()
+        my_path_default.write_text('my_int = 1\nmy_bool = False\n')
+        my_path.write_text('my_int = 2\n')
+        # read input from both temporary test files
+        my_paths = [str(inlist_file.resolve()), str(my_path)]
+        my_output = InlistHandler.get_many(inlist_paths=my_paths)
+        # assert the output is ok, and kept apart per inlist
+        assert my_output == {
+            my_paths[0]: self.expected_output,
+            my_paths[1]: {'my_int': 2, 'my_bool': False},
+        }
@@ -54,3 +54,54 @@ class TestTomlInlistHandler:
         my_output = TomlInlistHandler.get_inlist_values(inlist_path=toml_file)
         # assert the output is ok
         assert my_output == self.expected_output
+
+    def test_cached_read(self, tmp_path):
+        """Test whether cached toml input info is isolated from callers and refreshed when the file changes."""
+        # generate a temporary toml file
+        my_path = tmp_path / 'cache.toml'
+        my_path.write_text('[my-table]\nmy-list = [1, 2]\n')
+        # read the input and alter the (nested) output
+        my_output = TomlInlistHandler.get_inlist_values(inlist_path=my_path)
+        assert isinstance(my_output['my-table'], dict)
+        my_output['my-table']['my-list'].append(3)
+        # assert the cached output was not altered
+        assert TomlInlistHandler.get_inlist_values(inlist_path=my_path) == {
+            'my-table': {'my-list': [1, 2]}
+        }
+        # alter the toml file and assert the new values are read
+        my_path.write_text('[my-table]\nmy-list = [10, 20, 30]\n')
+        assert TomlInlistHandler.get_inlist_values(inlist_path=my_path) == {
+            'my-table': {'my-list': [10, 20, 30]}
+        }
+
+    def test_toml_read_many(self, toml_file, tmp_path):
+        """Test whether the toml input info of multiple files can be read."""
+        # generate a second temporary toml file
+        my_path = tmp_path / 'second.toml'
+        my_path.write_text('[my-table]\nmy-none = {}\n')
+        # read Toml input from both temporary test files
+        my_output = TomlInlistHandler.get_many(
+            inlist_paths=[toml_file, my_path]
+        )
+        # assert the output is ok
+        assert my_output == {
+            toml_file: self.expected_output,
+            my_path: {'my-table': {'my-none': None}},
+        }
+
+    def test_toml_read_deep(self, tmp_path):
+        """Test whether deeply nested toml input info can be read."""
+        # generate a temporary toml file containing a deeply nested table
+        my_keys = [f'k{_i}' for _i in range(1200)]
+        my_path = tmp_path / 'deep.toml'
+        my_path.write_text(
+            f"[{'.'.join(my_keys)}]\n"
+            'my-list = [[1], [{a = 2}]]\n'
+            'my-none = {}\n'
+        )
+        # read Toml input from the temporary test file
+        my_output = TomlInlistHandler.get_inlist_values(inlist_path=my_path)
+        # walk down to the deepest table and assert the output is ok
+        for my_key in my_keys:
+            my_output = my_output[my_key]
+        assert my_output == {'my-list': [[1], [{'a': 2}]], 'my-none': None}